@@ -65,6 +65,7 @@
 #define MODBUS_CMD_GET_PIN            0x8002                    //!< Remote command: corresponds to digitalRead()
 #define MODBUS_CMD_DELAY              0x8003                    //!< Remote command: corresponds to delay()
 #define MODBUS_CMD_DELAY_NOSERIAL     0x8004                    //!< Remote command: corresponds to delay() w/o UART buffering
+#define MODBUS_CMD_MULTI              0x8005                    //!< Remote command: execute list of commands in one transaction
 #define MODBUS_CMD_TEST               0xBFFF                    //!< Remote command: dummy test command
 
 // ModbusControl error codes. Stored in holdReg[1] in case of an error
@@ -82,6 +83,10 @@ uint16_t  regModbus[MODBUS_NUM_HOLD_REG];
 // Modbus RTU slave instance
 Modbus    modbus_slave(MODBUS_SERIAL, MODBUS_ID, MODBUS_RS485_CTRL_PIN);
 
+// multi-command state: regModbus[] index of current sub-command block (0=inactive) and remaining sub-commands
+uint16_t  multiIdx = 0;
+uint16_t  multiNum = 0;
+
 
 /*-----------------------------------------------------------------------------
     MODBUS HANDLER FUNCTIONS
@@ -107,6 +112,10 @@ uint8_t writeHoldingRegs(uint8_t fc, uint16_t address, uint16_t length)
     DEBUG_SERIAL.println("writeHoldingRegs():");
   #endif
 
+  // new command written -> abort running multi-command, restart block walk at index 2
+  if (address == 0)
+    multiIdx = 0;
+
   // loop over data to write
   for (uint16_t i=0; i<length; i++)
   {
@@ -339,6 +348,51 @@ void handle_ModbusControl(void)
   // command received (bit 15 in regModbus[0] == 1)
   if ((*cmd) & 0x8000) {
 
+    // multi-command: in data[0]=number of sub-commands, followed by one block [cmd, len, data[0..len-1]] per
+    // sub-command. Execute one block per call via below switch and return results in block data. Don't change!
+    if ((*cmd) == MODBUS_CMD_MULTI)
+    {
+      // start multi-command
+      if (multiIdx == 0)
+      {
+        multiIdx = 2;
+        multiNum = data[0];
+      }
+
+      // no (more) sub-commands -> done
+      if (multiNum == 0)
+      {
+        multiIdx = 0;
+        (*cmd) &= 0x7fff;
+        return;
+      }
+
+      // check block range
+      if (((multiIdx+1) > (MODBUS_NUM_HOLD_REG-1)) || ((multiIdx+1+regModbus[multiIdx+1]) > (MODBUS_NUM_HOLD_REG-1)))
+      {
+        // optional debug output
+        #if defined(DEBUG_SERIAL) && defined(DEBUG_EXECUTE_COMMAND)
+          DEBUG_SERIAL.println("handle_ModbusControl(): Error, illegal multi-command block");
+        #endif
+
+        // set error indication and code, command processed
+        multiIdx = 0;
+        data[0] = MODBUS_ERROR_ILLEGAL_PARAM;
+        (*cmd) = ((*cmd) | 0x4000) & 0x7fff;
+        return;
+
+      } // illegal block
+
+      // execute sub-command below
+      cmd  = &(regModbus[multiIdx]);
+      data = &(regModbus[multiIdx+2]);
+
+    } // multi-command
+
+    // new single command -> abort stale multi-command
+    else
+      multiIdx = 0;
+
     // execute command
     switch (*cmd) {
 
@@ -538,6 +592,25 @@ void handle_ModbusControl(void)
     // command processed -> clear bit 15 in regModbus[0]. Don't change!
     (*cmd) &= 0x7fff;
 
+    // multi-command: sub-command processed -> continue with next block. Finish after last block or on error.
+    // On error, return error code of sub-command in regModbus[1]. Don't change!
+    if (multiIdx != 0)
+    {
+      multiNum--;
+      if ((*cmd) & 0x4000)
+      {
+        regModbus[0] |= 0x4000;
+        regModbus[1] = data[0];
+        multiNum = 0;
+      }
+      multiIdx += 2 + cmd[1];
+      if (multiNum == 0)
+      {
+        multiIdx = 0;
+        regModbus[0] &= 0x7fff;
+      }
+    }
+
     // toggle debug pin to indicate command execution (optional)
     #if defined(PIN_DEBUG)
       digitalWrite(PIN_DEBUG, !digitalRead(PIN_DEBUG));
@@ -62,13 +62,24 @@ Class
 ###########
 # IMPORT REQUIRED MODULES
 ###########
-import inspect
+import serial
 import serial.tools.list_ports
 import modbus_tk.modbus as modbus
 import modbus_tk.modbus_rtu as modbus_rtu
 import modbus_tk.defines as modbus_defines
 from modbus_tk.exceptions import ModbusInvalidResponseError
+from modbus_tk.hooks import call_hooks
+import os
+import sys
 import time
+import array
+import struct
+import contextlib
+import functools
+import inspect
+import threading
+import concurrent.futures
+import asyncio
 from enum import Enum
 import logging
 logger = logging.getLogger(__name__)
@@ -82,9 +93,25 @@ logger = logging.getLogger(__name__)
 # Misc constants
 #######################
 MODBUSCONTROL_PROTOCOL = "1.0"       # ModbusControl protocol version (must match client)
+MODBUSCONTROL_PROTOCOL_INT = int(round(float(MODBUSCONTROL_PROTOCOL) * 10))  # as read from client (x.x -> 10*x.x)
 MODBUSCONTROL_ADDR_PROTOCOL = 0         # Modbus input register address: ModbusControl protocol version
 
 
+#######################
+# Max. number of registers per Modbus transaction (Modbus RTU limit for WRITE_MULTIPLE_REGISTERS is 123)
+#######################
+MODBUS_BLOCKSIZE = 123
+
+
+#######################
+# Modbus low-level function codes (bound once to avoid module lookups)
+#######################
+_FC_READ_INPUT = modbus_defines.READ_INPUT_REGISTERS
+_FC_READ_HOLD = modbus_defines.READ_HOLDING_REGISTERS
+_FC_WRITE_MULT = modbus_defines.WRITE_MULTIPLE_REGISTERS
+_FC_READ_WRITE = modbus_defines.READ_WRITE_MULTIPLE_REGISTERS
+
+
 #######################
 # Modbus low-level return codes
 #######################
@@ -103,6 +130,10 @@ class ModbusStatus(Enum):
     UNKNOWN = 255
 
 
+# lookup Modbus return code -> name, avoids Enum construction on error path
+_STATUS_NAMES = {_status.value: _status.name for _status in ModbusStatus}
+
+
 #######################
 # ModbusControl high-level return codes
 #######################
@@ -118,6 +149,229 @@ class ModbusControlError(Exception):
     pass
 
 
+#######################
+# Convert raw register payload
+#######################
+def _array_from_be(data: bytes) -> array.array:
+    """Convert big-endian Modbus register payload to array('H') in native byte order w/o unpacking to ints"""
+    _values = array.array("H")
+    _values.frombytes(data)
+    if sys.byteorder == "little":
+        _values.byteswap()
+    return _values
+
+
+#######################
+# Precompiled big-endian register formats, one per number of registers
+#######################
+@functools.lru_cache(maxsize=None)
+def _regs_struct(num: int) -> struct.Struct:
+    """Return compiled struct for num big-endian 16b registers. Is created once per num"""
+    return struct.Struct(">%dH" % num)
+
+
+#######################
+# Modbus RTU CRC16 (polynomial 0xA001 reflected, init 0xFFFF). Table is computed once on import
+#######################
+def _crc16_table() -> tuple:
+    """Compute lookup table for byte-wise Modbus CRC16"""
+    _table = []
+    for _byte in range(256):
+        _crc = _byte
+        for _ in range(8):
+            _crc = (_crc >> 1) ^ 0xA001 if _crc & 1 else _crc >> 1
+        _table.append(_crc)
+    return tuple(_table)
+
+_CRC16_TABLE = _crc16_table()
+
+def _crc16(data: bytes, _table: tuple = _CRC16_TABLE) -> int:
+    """Modbus CRC16 of data. Is transmitted low byte first. CRC over a frame including its CRC is 0"""
+    _crc = 0xFFFF
+    for _byte in data:
+        _crc = (_crc >> 8) ^ _table[(_crc ^ _byte) & 0xFF]
+    return _crc
+
+
+#######################
+# Cached list of serial ports
+#######################
+_PORTS_CACHE_TIME = 5.0     # max. age of cached port list [s]
+
+@functools.lru_cache(maxsize=1)
+def _comports_cached(time_bucket: int) -> tuple:
+    """List serial port names. Cached per time bucket, as enumeration takes tens of ms"""
+    return tuple(_comport.device for _comport in serial.tools.list_ports.comports())
+
+
+#######################
+# Serialize Modbus transactions per client
+#######################
+def _synchronized(method):
+    """Decorator to execute a BaseClient method under the client lock. Allows concurrent use from threads.
+    With dedicated I/O thread (async_io=True) calls from other threads are queued to it and waited for"""
+    @functools.wraps(method)
+    def _wrapper(self, *args, **kwargs):
+        if (self._io_executor is not None) and (threading.get_ident() != self._io_thread):
+            return self._io_executor.submit(_wrapper, self, *args, **kwargs).result()
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return _wrapper
+
+
+########################################################
+# Modbus RTU master with length-bounded receive
+########################################################
+class _FastRtuMaster(modbus_rtu.RtuMaster):
+    """
+    Modbus RTU master which reads exactly the expected response length.
+
+    Reads the first 5 bytes in one bulk read, which is a complete exception response (function code bit 7 set).
+    For a regular response the remaining bytes of the expected response are read in a second bulk read.
+    This avoids per-byte reads and waiting for the receive timeout on error responses. CRC is checked by RtuQuery.
+
+    For register read/write, fast_execute() builds and checks frames with precompiled structs and table-based
+    CRC16 instead of the generic modbus_tk query dispatch.
+    """
+
+    # precompiled request headers (slave, function code, address, quantity [, byte count]) and CRC
+    _REQ_READ = struct.Struct(">BBHH")
+    _REQ_WRITE = struct.Struct(">BBHHB")
+    _CRC = struct.Struct("<H")
+
+    # max. request frame length: WRITE_MULTIPLE_REGISTERS with 123 registers (7 + 2*123 + 2 bytes)
+    _MAX_REQUEST = 256
+
+    def __init__(self, *args, **kwargs):
+        """Constructor, see RtuMaster. Allocates scratch buffer for building request frames"""
+        modbus_rtu.RtuMaster.__init__(self, *args, **kwargs)
+        self._tx_buf = bytearray(self._MAX_REQUEST)
+        self._tx_view = memoryview(self._tx_buf)
+
+    def _read_exactly(self, length: int) -> bytes:
+        """Read up to length bytes from serial port. Stop early only on receive timeout"""
+        _data = b""
+        while len(_data) < length:
+            _chunk = self._serial.read(length - len(_data))
+            if not _chunk:
+                break
+            _data += _chunk
+        return _data
+
+    def _recv(self, expected_length=-1):
+        """Receive the response from the slave"""
+
+        # length unknown -> use default receive
+        if expected_length < 0:
+            return modbus_rtu.RtuMaster._recv(self, expected_length)
+
+        # read min. response length (= exception response), then remaining bytes of regular response
+        _response = self._read_exactly(min(5, expected_length))
+        if (len(_response) == 5) and not (_response[1] & 0x80):
+            _response += self._read_exactly(expected_length - 5)
+
+        _retval = call_hooks("modbus_rtu.RtuMaster.after_recv", (self, _response))
+        if _retval is not None:
+            return _retval
+        return _response
+
+    def fast_execute(self, slave, function_code, starting_address, quantity_of_x=0, output_value=0,
+                     write_starting_address_fc23=0, returns_raw=False):
+        """Same as execute(threadsafe=False), but for READ_INPUT_REGISTERS, READ_HOLDING_REGISTERS and
+        WRITE_MULTIPLE_REGISTERS frames are built and checked directly. Other function codes or verbose mode
+        use generic execute()"""
+
+        # other function codes or frame logging -> generic modbus_tk execute
+        if self._verbose or (function_code not in (_FC_READ_INPUT, _FC_READ_HOLD, _FC_WRITE_MULT)):
+            return self.execute(slave=slave, function_code=function_code, starting_address=starting_address,
+                                quantity_of_x=quantity_of_x, output_value=output_value,
+                                write_starting_address_fc23=write_starting_address_fc23, returns_raw=returns_raw,
+                                threadsafe=False)
+
+        # build request frame incl. CRC in scratch buffer and get expected response length
+        _buf = self._tx_buf
+        if function_code == _FC_WRITE_MULT:
+            _num = len(output_value)
+            self._REQ_WRITE.pack_into(_buf, 0, slave, function_code, starting_address, _num, 2 * _num)
+            _regs_struct(_num).pack_into(_buf, 7, *[_value & 0xFFFF for _value in output_value])
+            _length = 7 + 2 * _num
+            _expected_length = 8
+        else:
+            self._REQ_READ.pack_into(_buf, 0, slave, function_code, starting_address, quantity_of_x)
+            _length = 6
+            _expected_length = 5 + 2 * quantity_of_x
+        self._CRC.pack_into(_buf, _length, _crc16(self._tx_view[:_length]))
+        _request = self._tx_view[:_length + 2]
+
+        # send request and receive response
+        self.open()
+        self._send(_request)
+        _response = self._recv(_expected_length)
+
+        # check response frame
+        if len(_response) < 5:
+            raise ModbusInvalidResponseError("Response length is invalid %d" % len(_response))
+        if _response[0] != slave:
+            raise ModbusInvalidResponseError("Response address %d is different from request address %d" %
+                                             (_response[0], slave))
+        if _crc16(_response) != 0:
+            raise ModbusInvalidResponseError("Invalid CRC in response")
+        if _response[1] & 0x80:
+            raise modbus.ModbusError(_response[2])
+
+        # write -> return (address, number) of written registers
+        if function_code == _FC_WRITE_MULT:
+            if len(_response) != 8:
+                raise ModbusInvalidResponseError("Response length is invalid %d" % len(_response))
+            return struct.unpack(">HH", _response[2:6])
+
+        # read -> check byte count and return data
+        _data = _response[3:-2]
+        if (_response[2] != len(_data)) or (len(_data) != 2 * quantity_of_x):
+            raise ModbusInvalidResponseError("Byte count is %d while actual number of bytes is %d" %
+                                             (_response[2], len(_data)))
+        if returns_raw:
+            return _data
+        return _regs_struct(quantity_of_x).unpack(_data)
+
+
+########################################################
+# Client methods bound to one slave
+########################################################
+class _SlaveView:
+    """
+    Proxy returned by BaseClient.bind(). Forwards method calls to the client with the slave identifier preset.
+    Slave is passed positionally to methods with first parameter 'slave', e.g. device.set_pin(13, 1), and as
+    keyword to methods taking only keyword arguments, e.g. aread_input_register(). Other methods and attributes
+    are forwarded unchanged. Bound methods are created once per name and cached in the instance.
+    """
+
+    def __init__(self, client, slave: int):
+        self._client = client
+        self._slave = slave
+
+    def __getattr__(self, name):
+        # only called for names not yet cached. Fetch own attributes directly to avoid recursion if missing
+        _client = object.__getattribute__(self, "_client")
+        _slave = object.__getattribute__(self, "_slave")
+        _attr = getattr(_client, name)
+
+        # don't wrap or cache data attributes, as they may change
+        if not callable(_attr):
+            return _attr
+
+        # bind slave depending on signature and cache
+        _params = list(inspect.signature(_attr).parameters.values())
+        if _params and (_params[0].name == "slave"):
+            _bound = functools.partial(_attr, _slave)
+        elif any(_param.kind is inspect.Parameter.VAR_KEYWORD for _param in _params):
+            _bound = functools.partial(_attr, slave=_slave)
+        else:
+            _bound = _attr
+        setattr(self, name, _bound)
+        return _bound
+
+
 ########################################################
 # ModbusControl base class for master
 ########################################################
@@ -132,9 +386,19 @@ class BaseClient:
     baud : int
         Communication speed [Baud]. Must be supported by driver
     timeout_modbus : float
-        Default Modbus RTU receive timeout [s]
+        Default Modbus RTU receive timeout [s]. None = 20ms if USB latency timer was reduced, else 100ms
     timeout_command : float
         Default command execution timeout [s]
+    boot_delay : float
+        Max. time to wait for client to become ready, e.g. Arduino bootloader [s]. None = don't wait
+    async_io : bool
+        Run all Modbus transactions in a dedicated thread owning the port, e.g. for GUI or asyncio applications
+    verbose : bool
+        Log Modbus RTU frames via modbus_tk and applied realtime settings. None = only if debug output is enabled
+    realtime : bool
+        Pin I/O thread to last allowed CPU and raise its priority (POSIX: SCHED_FIFO, requires CAP_SYS_NICE or root.
+        Windows: HIGH_PRIORITY_CLASS, may require admin). Applies to I/O thread if async_io, else calling thread.
+        Linux: also sets USB-serial latency_timer to 1ms via sysfs (system-wide until re-plug)
 
     Returns
     -------
@@ -145,11 +409,25 @@ class BaseClient:
     >>> device = BaseClient(port="COM6", baud=115200)
     """
 
+    # number of client input and holding registers. Used to reject illegal ranges before Modbus transaction.
+    # Set in derived class to match client, None = only check Modbus address range
+    MODBUS_NUM_INPUT_REG = None
+    MODBUS_NUM_HOLD_REG = None
+
+    # client supports READ_WRITE_MULTIPLE_REGISTERS (FC23) and executes commands within the request. Then
+    # execute_command() writes the command and reads the result in one transaction. Set in derived class
+    MODBUS_FC23 = False
+
+    # client command code for executing a list of commands in one transaction, see execute_pipelined().
+    # Set in derived class, None = client has no multi-command and commands are executed one by one
+    MODBUS_CMD_MULTI = None
+
     #########
     # constructor
     #########
-    def __init__(self, port: str = "/dev/ttyUSB0", baud: int = 115200, timeout_modbus: float = 0.1,
-                 timeout_command: float = 0.2):
+    def __init__(self, port: str = "/dev/ttyUSB0", baud: int = 115200, timeout_modbus: float = None,
+                 timeout_command: float = 0.2, boot_delay: float = None, async_io: bool = False,
+                 verbose: bool = None, realtime: bool = False):
         """
         Create an object to control a Modbus RTU client via ModbusControl high-level protocol.
 
@@ -160,9 +438,19 @@ class BaseClient:
         baud : int
             Communication speed [Baud]. Must be supported by driver
         timeout_modbus : float
-            Default Modbus RTU receive timeout [s]
+            Default Modbus RTU receive timeout [s]. None = 20ms if USB latency timer was reduced, else 100ms
         timeout_command : float
             Default command execution timeout [s]
+        boot_delay : float
+            Max. time to wait for client to become ready, e.g. Arduino bootloader [s]. None = don't wait
+        async_io : bool
+            Run all Modbus transactions in a dedicated thread owning the port, e.g. for GUI or asyncio applications
+        verbose : bool
+            Log Modbus RTU frames via modbus_tk and applied realtime settings. None = only if debug output is enabled
+        realtime : bool
+            Pin I/O thread to last allowed CPU and raise its priority (POSIX: SCHED_FIFO, requires CAP_SYS_NICE or root.
+            Windows: HIGH_PRIORITY_CLASS, may require admin). Applies to I/O thread if async_io, else calling thread.
+            Linux: also sets USB-serial latency_timer to 1ms via sysfs (system-wide until re-plug)
 
         Returns
         -------
@@ -173,43 +461,318 @@ class BaseClient:
         >>> device = BaseClient(port="COM6", baud=115200)
         """
 
+        # lock to serialize transactions on this port. Replaces global modbus_tk lock, see execute(threadsafe=False)
+        self._lock = threading.RLock()
+
+        # optional dedicated I/O thread. Transactions are queued to it, see _synchronized()
+        self._io_executor = None
+        self._io_thread = None
+        self._realtime = realtime
+
+        # Modbus RTU frame and realtime setup logging only on request or if debug output is enabled
+        self._verbose = verbose if verbose is not None else logger.isEnabledFor(logging.DEBUG)
+        if async_io:
+            self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1,
+                                                                      thread_name_prefix="ModbusControl_io",
+                                                                      initializer=self._init_io_thread)
+        elif realtime:
+            self._set_realtime()
+
         # try opening serial port for Modbus RTU
         try:
 
             # store parameters
             self._port = port
             self._baud = baud
-            self._timeout_modbus = timeout_modbus
             self._timeout_command = timeout_command
 
+            # cache for static input registers, key is (slave, address, num_out)
+            self._static_cache = {}
+
+            # commands triggered with execute_command(wait=False), key is slave.
+            # Value is (command, start time, earliest completion time, command timeout)
+            self._pending_commands = {}
+
+            # Modbus RTU character time (11 bits) and silent interval (3.5 characters) [s].
+            # Silent interval has 75us floor, below that OS sleep granularity dominates
+            self._char_time = 11.0 / baud
+            self._silent_interval = max(3.5 * self._char_time, 75e-6)
+
+            # min. delay before retrying a failed transaction: silent interval with 1.75ms floor as specified
+            # for >19200 Baud [s]. Is extended by response frame time in _execute_raw()
+            self._retry_sleep = max(3.5 * self._char_time, 1.75e-3)
+
             # open port to Modbus client
-            self.client = modbus_rtu.RtuMaster(serial.Serial(port=port, baudrate=baud,
-                                               bytesize=8, parity='N', stopbits=float(1), xonxoff=False))
+            self._serial = serial.Serial(port=port, baudrate=baud, bytesize=8, parity='N', stopbits=float(1),
+                                         xonxoff=False)
+
+            # reduce USB-serial latency timer (POSIX only, e.g. FTDI 16ms -> 1ms). Ignore if not supported
+            try:
+                self._serial.set_low_latency_mode(True)
+                self._low_latency = True
+            except (IOError, OSError, ValueError, AttributeError, NotImplementedError):
+                self._low_latency = False
+
+            # FTDI on Linux: additionally set latency timer via sysfs for kernels w/o ASYNC_LOW_LATENCY support.
+            # Setting is system-wide and persists until re-plug, therefore only with realtime. Requires write access,
+            # else ignore. VMIN/VTIME are derived by pyserial from the timeouts set below
+            if sys.platform.startswith("linux"):
+                if realtime:
+                    _latency_timer = "/sys/bus/usb-serial/devices/%s/latency_timer" % \
+                                     os.path.basename(os.path.realpath(port))
+                    try:
+                        with open(_latency_timer, "w") as _file:
+                            _file.write("1")
+                        self._low_latency = True
+                        if self._verbose:
+                            logger.info("set '%s' to 1ms (system-wide until re-plug)", _latency_timer)
+                    except OSError as _err:
+                        if self._verbose:
+                            logger.info("setting '%s' failed (%s)", _latency_timer, _err)
+
+            # macOS: set receive data latency via IOSSDATALAT ioctl (=_IOW('T', 0, unsigned long)) [us]
+            elif sys.platform == "darwin":
+                try:
+                    import fcntl
+                    fcntl.ioctl(self._serial.fileno(), 0x80085400, struct.pack("L", 1))
+                    self._low_latency = True
+                except (ImportError, OSError, ValueError, AttributeError):
+                    pass
+
+            # latency could not be reduced, e.g. on Windows (set via driver properties) -> only inform
+            if not self._low_latency:
+                logger.info("USB-serial latency timer of port '%s' not reduced, set via driver if required", port)
+
+            # default receive timeout. Responses are read by expected length, so timeout only limits waiting for
+            # missing or corrupted frames. With 1ms latency timer 20ms suffices, else allow for 16ms USB latency
+            if timeout_modbus is None:
+                timeout_modbus = 0.02 if self._low_latency else 0.1
+            self._timeout_modbus = timeout_modbus
+
+            # attach Modbus RTU master to port. Note: RtuMaster flushes Rx/Tx buffers before each request,
+            # so stale bytes from an aborted transaction don't delay the next response
+            self.client = _FastRtuMaster(self._serial)
+
+            # end frame reception after a 4 character gap (RTU silent interval). Overrides RtuMaster default.
+            # On Windows pyserial maps this to COMMTIMEOUTS.ReadIntervalTimeout (min. 1ms) on every timeout change
+            self._serial.inter_byte_timeout = 4 * self._char_time
 
-            # set Modbus receive timeout [s]
-            self.client.set_timeout(timeout_modbus)
+            # set Modbus receive timeout [s]. Remember current value to skip redundant updates
+            self._current_timeout = None
+            self._set_timeout(timeout_modbus)
 
-            # enable Modbus RTU logging
-            self.client.set_verbose(True)
+            # enable Modbus RTU frame logging, see above
+            self.client.set_verbose(self._verbose)
 
         # opening COM port failed -> list ports and raise exception
-        except BaseException as _err:
+        except (serial.SerialException, OSError, ValueError) as _err:
+            _ports = self.available_ports()
             _msg = "Opening port '%s' failed with %s\n" % (port, str(_err))
             _msg += "Available ports are: "
-            _ports = serial.tools.list_ports.comports()
-            for _port in _ports:
-                _msg += "  %s" % _port.device
-            raise ModbusControlError(_msg)
+            _msg += ", ".join(_ports)
+            _error = ModbusControlError(_msg)
+            _error.ports = _ports
+            raise _error
+
+        # optionally wait until client responds, e.g. after Arduino bootloader
+        if boot_delay is not None:
+            self.wait_for_client(timeout=boot_delay)
 
         # return Modbus object with COM port configured and protocol versions checked
         return
 
 
+    #########
+    # List available serial ports
+    #########
+    @classmethod
+    def available_ports(cls) -> list:
+        """List names of available serial ports. Result is cached for _PORTS_CACHE_TIME, e.g. for port scans
+
+        Returns
+        -------
+        list
+            names of available serial ports
+
+        Examples
+        --------
+        >>> ports = BaseClient.available_ports()
+        """
+        return list(_comports_cached(int(time.monotonic() // _PORTS_CACHE_TIME)))
+
+
+    #########
+    # Initialize dedicated I/O thread (don't modify)
+    #########
+    def _init_io_thread(self):
+        """Remember identity of dedicated I/O thread. Calls from it are executed directly"""
+        self._io_thread = threading.get_ident()
+        if self._realtime:
+            self._set_realtime()
+
+
+    #########
+    # Pin calling thread to one CPU and raise priority (don't modify)
+    #########
+    def _set_realtime(self):
+        """Pin calling thread to last CPU available to the process (avoids IRQ-busy CPU 0) and raise its scheduling
+        priority. Reduces USB-serial latency jitter. Both steps are independent, on failure only log a warning"""
+
+        # Windows: priority via process class, affinity from allowed process CPUs
+        if sys.platform == "win32":
+            import ctypes
+            _kernel32 = ctypes.windll.kernel32
+            try:
+                if not _kernel32.SetPriorityClass(_kernel32.GetCurrentProcess(), 0x00000080):  # HIGH_PRIORITY_CLASS
+                    raise OSError(ctypes.GetLastError(), "SetPriorityClass() failed")
+                if self._verbose:
+                    logger.info("_set_realtime(): set HIGH_PRIORITY_CLASS")
+            except OSError as _err:
+                logger.warning("_set_realtime(): priority failed (%s), continue with normal priority", _err)
+            try:
+                _mask_process = ctypes.c_size_t()
+                _mask_system = ctypes.c_size_t()
+                if not _kernel32.GetProcessAffinityMask(_kernel32.GetCurrentProcess(), ctypes.byref(_mask_process),
+                                                        ctypes.byref(_mask_system)):
+                    raise OSError(ctypes.GetLastError(), "GetProcessAffinityMask() failed")
+                _cpu = _mask_process.value.bit_length() - 1
+                if not _kernel32.SetThreadAffinityMask(_kernel32.GetCurrentThread(), ctypes.c_size_t(1 << _cpu)):
+                    raise OSError(ctypes.GetLastError(), "SetThreadAffinityMask() failed")
+                if self._verbose:
+                    logger.info("_set_realtime(): pinned thread to CPU %d", _cpu)
+            except OSError as _err:
+                logger.warning("_set_realtime(): CPU affinity failed (%s), continue on all CPUs", _err)
+
+        # POSIX: affinity from allowed process CPUs (e.g. taskset, cgroups), priority via SCHED_FIFO.
+        # Note: sched_setaffinity() is not available on macOS
+        else:
+            try:
+                _cpu = max(os.sched_getaffinity(0))
+                os.sched_setaffinity(0, {_cpu})
+                if self._verbose:
+                    logger.info("_set_realtime(): pinned thread to CPU %d", _cpu)
+            except (OSError, AttributeError) as _err:
+                logger.warning("_set_realtime(): CPU affinity failed (%s), continue on all CPUs", _err)
+            try:
+                _priority = os.sched_get_priority_max(os.SCHED_FIFO) // 2
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_priority))
+                if self._verbose:
+                    logger.info("_set_realtime(): set SCHED_FIFO priority %d", _priority)
+            except (OSError, AttributeError) as _err:
+                logger.warning("_set_realtime(): priority failed (%s), continue with normal priority", _err)
+
+
+    #########
+    # Set Modbus receive timeout only if changed (don't modify)
+    #########
+    def _set_timeout(self, timeout: float):
+        """Set Modbus RTU receive timeout. Skip if value is None or already active, which avoids
+        a serial port reconfiguration (syscall) per transaction.
+
+        Parameters
+        ----------
+        timeout : float
+           Modbus RTU receive timeout [s]. None = keep current timeout
+        """
+        if (timeout is not None) and (timeout != self._current_timeout):
+            self.client.set_timeout(timeout)
+            self._current_timeout = timeout
+
+
+    #########
+    # Change default Modbus receive timeout
+    #########
+    @_synchronized
+    def set_modbus_timeout(self, timeout: float):
+        """Change default Modbus RTU receive timeout. Is kept until next change, e.g. after persist_timeout=True
+
+        Parameters
+        ----------
+        timeout : float
+           Modbus RTU receive timeout [s]
+
+        Examples
+        --------
+        >>> device.set_modbus_timeout(0.5)
+        """
+        self._timeout_modbus = timeout
+        self._set_timeout(timeout)
+
+
+    #########
+    # Temporarily change Modbus receive timeout (don't modify)
+    #########
+    @contextlib.contextmanager
+    def _scoped_timeout(self, timeout: float = None, persist: bool = False):
+        """Context manager to set Modbus RTU receive timeout and restore previous value on exit.
+        Is a no-op if timeout is None or already active, which avoids needless serial port reconfiguration.
+
+        Parameters
+        ----------
+        timeout : float
+           Modbus RTU receive timeout [s]
+        persist : bool
+           keep timeout on exit as new default, see set_modbus_timeout()
+        """
+
+        # keep timeout -> set as new default and don't restore
+        if persist and (timeout is not None):
+            self.set_modbus_timeout(timeout)
+            yield
+            return
+
+        # timeout not specified or already active -> nothing to do
+        if timeout is None or timeout == self._current_timeout:
+            yield
+            return
+
+        # set new timeout and restore previous value on exit
+        _previous = self._current_timeout
+        self._set_timeout(timeout)
+        try:
+            yield
+        finally:
+            self._set_timeout(_previous)
+
+
+    #########
+    # Check register range before Modbus transaction (don't modify)
+    #########
+    @staticmethod
+    def _check_range(function: str, address: int, num: int, num_reg: int = None):
+        """Check register range against number of client registers and Modbus address range.
+        On error raise exception 'ModbusControlError' without Modbus transaction.
+
+        Parameters
+        ----------
+        function : str
+            name of calling function for error message
+        address : int
+            starting index of client register
+        num : int
+            number of 16b registers to access
+        num_reg : int
+            number of client registers. None = only check Modbus address range
+
+        Returns
+        -------
+        nothing. On error raise exception 'ModbusControlError'
+        """
+        _limit = num_reg if num_reg is not None else 0x10000
+        if (address is None) or (num is None) or (address < 0) or (num < 1) or (address + num > _limit):
+            _msg = "%s(): illegal register range address=%s, num=%s (max. %d registers), abort" % \
+                   (function, str(address), str(num), _limit)
+            logger.error(_msg)
+            raise ModbusControlError(_msg)
+
+
     #########
     # Read input registers from ModbusControl client (don't modify)
     #########
+    @_synchronized
     def read_input_register(self, slave: int = 1, address: int = None, num_out: int = None,
-                            timeout_modbus: float = None, timeout_command: float = None) -> dict:
+                            timeout_modbus: float = None, timeout_command: float = None,
+                            cacheable: bool = False, raw: bool = False, persist_timeout: bool = False) -> dict:
         """Read content of Modbus RTU client input registers via READ_INPUT_REGISTERS.
 
         Parameters
@@ -224,82 +787,143 @@ class BaseClient:
            Modbus RTU receive timeout [s]
         timeout_command : float
            command execution timeout [s]
+        cacheable : bool
+           registers are static during connection, e.g. versions. Read only once and return cached values
+        raw : bool
+           return values as compact array.array('H') instead of list, e.g. for large reads. Skips unpacking
+           to ints and supports buffer protocol, e.g. numpy.frombuffer(values, dtype=numpy.uint16)
+        persist_timeout : bool
+           keep timeout_modbus after call instead of restoring previous value. Change via set_modbus_timeout()
 
         Returns
         -------
         dict
-            "values": list of returned values (int16)
+            "values": list (or array.array('H') if raw) of returned values (int16)
         """
 
-        # Set Modbus receive timeout [s]. Required for long execution times
-        if timeout_modbus is not None:
-            self.client.set_timeout(timeout_modbus)
+        # static registers already read -> skip Modbus transaction
+        if cacheable and (slave, address, num_out) in self._static_cache:
+            _cached = self._static_cache[(slave, address, num_out)]
+            return {"values": array.array("H", _cached) if raw else list(_cached)}
+
+        # check register range before Modbus transaction
+        self._check_range("read_input_register", address, num_out, self.MODBUS_NUM_INPUT_REG)
+
+        # split in chunks of MODBUS_BLOCKSIZE registers to avoid buffer overflow. Single block for short reads
+        if num_out <= MODBUS_BLOCKSIZE:
+            _blocks = [(address, num_out)]
+        else:
+            _end = address + num_out
+            _blocks = [(_start, min(MODBUS_BLOCKSIZE, _end - _start))
+                       for _start in range(address, _end, MODBUS_BLOCKSIZE)]
+
+        # Set Modbus receive timeout [s] for this call. Is restored on exit
+        with self._scoped_timeout(timeout_modbus, persist=persist_timeout):
+
+            # read input registers block by block. On invalid response only the failed block is retried,
+            # command timeout applies to complete call
+            _start_time = time.monotonic()
+            _result = bytearray(2 * num_out) if raw else [0] * num_out
+            for _block in _blocks:
+                _reg = self._execute_raw(slave=slave, function_code=_FC_READ_INPUT, address=_block[0], data=_block[1],
+                                         timeout_command=timeout_command, function="read_input_register",
+                                         start_time=_start_time, returns_raw=raw)
+                _offset = _block[0] - address
+                if raw:
+                    _result[2 * _offset:2 * _offset + len(_reg)] = _reg
+                else:
+                    _result[_offset:_offset + len(_reg)] = _reg
+            if raw:
+                _result = _array_from_be(_result)
+            logger.info("slave %d: read %d input registers starting at address %d -> %s",
+                        slave, num_out, address, _result)
 
-        # Set command timeout and start timeout. Is required for long execution times
-        _timeout_command = timeout_command if timeout_command is not None else self._timeout_command
-        _start_time = time.time()
+            # store static registers for later reads
+            if cacheable:
+                self._static_cache[(slave, address, num_out)] = list(_result)
 
+            # return result
+            return {"values": _result}
 
-        # split in chunks of 100B to avoid buffer underflow
-        _blocksize = 100
-        _blocks = []
-        _curr_address = address
-        while _curr_address < address + num_out:
-            _next_address = min(_curr_address + _blocksize, address + num_out)
-            _block = (_curr_address, _next_address - _curr_address)
-            _blocks.append(_block)
-            _curr_address = _next_address
 
-        # Retry loop for READ_INPUT_REGISTERS with timeout
-        while True:
+    #########
+    # Read multiple input register ranges with coalesced transactions (don't modify)
+    #########
+    @_synchronized
+    def read_input_register_multi(self, slave: int = 1, ranges: list = None, coalesce_gap: int = 4,
+                                  timeout_modbus: float = None, timeout_command: float = None) -> dict:
+        """Read several ranges of Modbus RTU client input registers via READ_INPUT_REGISTERS.
+        Neighbouring ranges are merged into a single Modbus transaction (max. MODBUS_BLOCKSIZE registers).
 
-            try:
-                # read input registers
-                _result = list()
-                for _block in _blocks:
-                    _reg = self.client.execute(slave=slave, function_code=modbus_defines.READ_INPUT_REGISTERS,
-                                               starting_address=_block[0], quantity_of_x=_block[1])
-                    _result = list(_reg) + _result
-                logger.info("slave %d: read %d input registers starting at address %d -> %s" %
-                            (slave, num_out, address, str(_result)))
-
-                # Restore Modbus timeout
-                if timeout_modbus is not None:
-                    self.client.set_timeout(self._timeout_modbus)
-
-                # return result
-                return {"values": _result}
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        ranges : list(tuple)
+            list of (address, num_out) pairs to read
+        coalesce_gap : int
+            max. number of unused registers between ranges to still merge them. Default 4, i.e. 8B payload,
+            which is cheaper than an additional transaction (13B frames + 2 silent intervals). Gap registers
+            are read as well. If client rejects a merged group with an exception response (e.g. unmapped gap
+            register), the ranges of that group are read separately. Use 0 to disable merging
+        timeout_modbus : float
+           Modbus RTU receive timeout [s]
+        timeout_command : float
+           command execution timeout [s]
 
-            # check for timeout
-            except ModbusInvalidResponseError as _err:
-                if time.time() - _start_time < _timeout_command:
-                    logger.warning("%s(): failed (%s), retry" % (inspect.stack()[0].function, str(_err)))
-                    time.sleep(0.05)  # Short delay before retrying
-                else:
-                    _msg = "%s(): timeout after %1.1fs (%s), abort" % \
-                           (inspect.stack()[0].function, (time.time()-_start_time), str(_err))
-                    logger.error(_msg)
-                    if timeout_modbus is not None:
-                        self.client.set_timeout(self._timeout_modbus)
-                    raise ModbusControlError(_msg)
+        Returns
+        -------
+        dict
+            "values": list of returned value lists (int16), in order of ranges
+        """
 
-            # check for other errors
-            except (modbus.ModbusError, BaseException) as _err:
-                if type(_err) is modbus.ModbusError:
-                    _err = ModbusStatus(_err.get_exception_code()).name
-                _msg = "%s(): failed with error '%s', abort" % \
-                       (inspect.stack()[0].function, str(_err))
-                logger.error(_msg)
-                if timeout_modbus is not None:
-                    self.client.set_timeout(self._timeout_modbus)
-                raise ModbusControlError(_msg)
+        # sort ranges by address and greedily merge close ranges into groups [start, end)
+        _order = sorted(range(len(ranges)), key=lambda _idx: ranges[_idx][0])
+        _groups = []
+        for _idx in _order:
+            _start, _end = ranges[_idx][0], ranges[_idx][0] + ranges[_idx][1]
+            if _groups and (_start - _groups[-1][1] <= coalesce_gap) and \
+                    (max(_end, _groups[-1][1]) - _groups[-1][0] <= MODBUS_BLOCKSIZE):
+                _groups[-1][1] = max(_end, _groups[-1][1])
+                _groups[-1][2].append(_idx)
+            else:
+                _groups.append([_start, _end, [_idx]])
+
+        # read each group with one transaction and split result back to requested ranges
+        _result = [None] * len(ranges)
+        for _start, _end, _members in _groups:
+            try:
+                _reg = self.read_input_register(slave=slave, address=_start, num_out=_end - _start,
+                                                timeout_modbus=timeout_modbus, timeout_command=timeout_command)
+
+            # exception response for merged group, e.g. ILLEGAL_DATA_ADDRESS for gap -> read ranges separately.
+            # Re-raise timeouts, port errors and errors of unmerged ranges
+            except ModbusControlError as _err:
+                if (len(_members) < 2) or not isinstance(_err.__cause__, modbus.ModbusError):
+                    raise
+                logger.warning("read_input_register_multi(): merged read of %d ranges at address %d failed, "
+                               "read separately", len(_members), _start)
+                for _idx in _members:
+                    _result[_idx] = self.read_input_register(slave=slave, address=ranges[_idx][0],
+                                                             num_out=ranges[_idx][1], timeout_modbus=timeout_modbus,
+                                                             timeout_command=timeout_command)["values"]
+                continue
+
+            for _idx in _members:
+                _offset = ranges[_idx][0] - _start
+                _result[_idx] = _reg["values"][_offset:_offset + ranges[_idx][1]]
+
+        # return result
+        return {"values": _result}
 
 
     #########
     # Read holding registers from ModbusControl client (don't modify)
     #########
+    @_synchronized
     def read_holding_register(self, slave: int = 1, address: int = None, num_out: int = None,
-                              timeout_modbus: float = None, timeout_command: float = None) -> dict:
+                              timeout_modbus: float = None, timeout_command: float = None,
+                              raw: bool = False, persist_timeout: bool = False) -> dict:
         """Read content of Modbus RTU client holding registers via READ_HOLDING_REGISTERS.
 
         Parameters
@@ -314,82 +938,61 @@ class BaseClient:
            Modbus RTU receive timeout [s]
         timeout_command : float
            command execution timeout [s]
+        raw : bool
+           return values as compact array.array('H') instead of list, e.g. for large reads. Skips unpacking
+           to ints and supports buffer protocol, e.g. numpy.frombuffer(values, dtype=numpy.uint16)
+        persist_timeout : bool
+           keep timeout_modbus after call instead of restoring previous value. Change via set_modbus_timeout()
 
         Returns
         -------
         dict
-            "values": list of returned values (int16)
+            "values": list (or array.array('H') if raw) of returned values (int16)
         """
 
-        # Set Modbus receive timeout [s]. Required for long execution times
-        if timeout_modbus is not None:
-            self.client.set_timeout(timeout_modbus)
-
-        # Set command timeout and start timeout. Is required for long execution times
-        _timeout_command = timeout_command if timeout_command is not None else self._timeout_command
-        _start_time = time.time()
-
-        # split in chunks of 100B to avoid buffer underflow. Start from top to bottom (addr 0 contains command)
-        _blocksize = 100
-        _blocks = []
-        _curr_address = address
-        while _curr_address < address + num_out:
-            _next_address = min(_curr_address + _blocksize, address + num_out)
-            _block = (_curr_address, _next_address - _curr_address)
-            _blocks.append(_block)
-            _curr_address = _next_address
-        _blocks.reverse()
-
-        # Retry loop for READ_HOLDING_REGISTERS with timeout
-        while True:
-
-            try:
-                # read holding registers
-                _result = list()
-                for _block in _blocks:
-                    _reg = self.client.execute(slave=slave, function_code=modbus_defines.READ_HOLDING_REGISTERS,
-                                               starting_address=_block[0], quantity_of_x=_block[1])
-                    _result = list(_reg) + _result
-                logger.info("slave %d: read %d holding registers starting at address %d -> %s" %
-                            (slave, num_out, address, str(_result)))
-
-                # Restore Modbus timeout
-                if timeout_modbus is not None:
-                    self.client.set_timeout(self._timeout_modbus)
-
-                # return result
-                return {"values": _result}
-
-            # check for timeout
-            except ModbusInvalidResponseError as _err:
-                if time.time() - _start_time < _timeout_command:
-                    logger.warning("%s(): failed (%s), retry" % (inspect.stack()[0].function, str(_err)))
-                    time.sleep(0.05)  # Short delay before retrying
+        # check register range before Modbus transaction
+        self._check_range("read_holding_register", address, num_out, self.MODBUS_NUM_HOLD_REG)
+
+        # split in chunks of MODBUS_BLOCKSIZE registers to avoid buffer overflow. Single block for short reads
+        if num_out <= MODBUS_BLOCKSIZE:
+            _blocks = [(address, num_out)]
+        else:
+            _end = address + num_out
+            _blocks = [(_start, min(MODBUS_BLOCKSIZE, _end - _start))
+                       for _start in range(address, _end, MODBUS_BLOCKSIZE)]
+
+        # Set Modbus receive timeout [s] for this call. Is restored on exit
+        with self._scoped_timeout(timeout_modbus, persist=persist_timeout):
+
+            # read holding registers block by block. On invalid response only the failed block is retried,
+            # command timeout applies to complete call
+            _start_time = time.monotonic()
+            _result = bytearray(2 * num_out) if raw else [0] * num_out
+            for _block in _blocks:
+                _reg = self._execute_raw(slave=slave, function_code=_FC_READ_HOLD, address=_block[0], data=_block[1],
+                                         timeout_command=timeout_command, function="read_holding_register",
+                                         start_time=_start_time, returns_raw=raw)
+                _offset = _block[0] - address
+                if raw:
+                    _result[2 * _offset:2 * _offset + len(_reg)] = _reg
                 else:
-                    _msg = "%s(): timeout after %1.1fs (%s), abort" % \
-                           (inspect.stack()[0].function, (time.time()-_start_time), str(_err))
-                    logger.error(_msg)
-                    if timeout_modbus is not None:
-                        self.client.set_timeout(self._timeout_modbus)
-                    raise ModbusControlError(_msg)
+                    _result[_offset:_offset + len(_reg)] = _reg
+            if raw:
+                _result = _array_from_be(_result)
+            logger.info("slave %d: read %d holding registers starting at address %d -> %s",
+                        slave, num_out, address, _result)
 
-            # check for other errors
-            except (modbus.ModbusError, BaseException) as _err:
-                if type(_err) is modbus.ModbusError:
-                    _err = ModbusStatus(_err.get_exception_code()).name
-                _msg = "%s(): failed with error '%s', abort" % \
-                       (inspect.stack()[0].function, str(_err))
-                logger.error(_msg)
-                if timeout_modbus is not None:
-                    self.client.set_timeout(self._timeout_modbus)
-                raise ModbusControlError(_msg)
+            # return result
+            return {"values": _result}
 
 
     #########
     # Write holding registers to ModbusControl client (don't modify)
     #########
+    @_synchronized
     def write_holding_register(self, slave: int = 1, address: int = None, values: list = None,
-                               timeout_modbus: float = None, timeout_command: float = None) -> dict:
+                               timeout_modbus: float = None, timeout_command: float = None,
+                               persist_timeout: bool = False) -> dict:
         """Write content to Modbus RTU client holding registers via WRITE_MULTIPLE_REGISTERS.
 
         Parameters
@@ -404,6 +1007,8 @@ class BaseClient:
            Modbus RTU receive timeout [s]
         timeout_command : float
            command execution timeout [s]
+        persist_timeout : bool
+           keep timeout_modbus after call instead of restoring previous value. Change via set_modbus_timeout()
 
         Returns
         -------
@@ -411,75 +1016,227 @@ class BaseClient:
             "status": Modbus return status
         """
 
-        # Set Modbus receive timeout [s]. Required for long execution times
-        if timeout_modbus is not None:
-            self.client.set_timeout(timeout_modbus)
+        # check register range before Modbus transaction
+        self._check_range("write_holding_register", address, len(values), self.MODBUS_NUM_HOLD_REG)
+
+        # split in chunks of MODBUS_BLOCKSIZE registers to avoid buffer overflow. Single block for short writes.
+        # Write from top to bottom (addr 0 contains command, i.e. must be written last)
+        if len(values) <= MODBUS_BLOCKSIZE:
+            _blocks = [(address, values)]
+        else:
+            _blocks = [(address + _idx, values[_idx:_idx + MODBUS_BLOCKSIZE])
+                       for _idx in reversed(range(0, len(values), MODBUS_BLOCKSIZE))]
+
+        # Set Modbus receive timeout [s] for this call. Is restored on exit
+        with self._scoped_timeout(timeout_modbus, persist=persist_timeout):
+
+            # write holding registers block by block. On invalid response only the failed block is retried,
+            # command timeout applies to complete call
+            _start_time = time.monotonic()
+            _result = [0, 0]
+            for _block in _blocks:
+                _reg = self._execute_raw(slave=slave, function_code=_FC_WRITE_MULT, address=_block[0], data=_block[1],
+                                         timeout_command=timeout_command, function="write_holding_register",
+                                         start_time=_start_time)
+                _result[0] = _reg[0]
+                _result[1] += _reg[1]
+            logger.info("slave %d: write %s to holding registers starting at address %d -> %s",
+                        slave, values, address, _result)
+
+            # return result
+            return {"status": _result}
+
+
+    #########
+    # Single Modbus transaction with retry (don't modify)
+    #########
+    def _execute_raw(self, slave: int = 1, function_code: int = None, address: int = None, data=None,
+                     timeout_command: float = None, function: str = None, start_time: float = None,
+                     num_read: int = None, returns_raw: bool = False) -> tuple:
+        """Execute a single Modbus RTU transaction without block splitting, retry on invalid response.
+        Caller must ensure that request fits into one block and set Modbus timeout.
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        function_code : int
+            Modbus function code, i.e. _FC_READ_INPUT, _FC_READ_HOLD, _FC_WRITE_MULT or _FC_READ_WRITE
+        address : int
+            starting index of client register
+        data : int or list
+            number of registers to read, or list of 16b values to write
+        timeout_command : float
+           command execution timeout [s]
+        function : str
+            name of calling function for error message
+        start_time : float
+            start of command timeout as time.monotonic() [s]. Share between blocks of one call. None = now
+        num_read : int
+            number of registers to read after writing data. Only for _FC_READ_WRITE
+        returns_raw : bool
+            return read data as big-endian bytes instead of unpacking to tuple. Only for reads
+
+        Returns
+        -------
+        tuple
+            returned values (read) or (address, number) of written registers (write). Bytes if returns_raw
+        """
+
+        # await previous command triggered w/o waiting. Client doesn't respond while executing it
+        if self._pending_commands and (slave in self._pending_commands):
+            self._complete_pending(slave)
 
         # Set command timeout and start timeout. Is required for long execution times
         _timeout_command = timeout_command if timeout_command is not None else self._timeout_command
-        _start_time = time.time()
-
-        # split in chunks of 100B to avoid buffer underflow. Start from top to bottom (addr 0 contains command)
-        _blocksize = 100
-        _blocks = []
-        for _idx in range(0, len(values), _blocksize):
-            _block = values[_idx:_idx+_blocksize]
-            _addr = address + (_idx // _blocksize) * _blocksize
-            _blocks.append((_addr, _block))
-        _blocks.reverse()
-
-        # Retry loop for WRITE_MULTIPLE_REGISTERS with timeout
-        while True:
+        _start_time = start_time if start_time is not None else time.monotonic()
 
-            try:
-                # Write command (in reg[0]) with parameters (in reg[1..N])
-                _result = [0, 0]
-                for _block in _blocks:
-                    _reg = self.client.execute(slave=slave, function_code=modbus_defines.WRITE_MULTIPLE_REGISTERS,
-                                               starting_address=_block[0], output_value=_block[1])
-                    _result[0] = _reg[0]
-                    _result[1] += _reg[1]
-                logger.info("slave %d: write %s to holding registers starting at address %d -> %s" %
-                            (slave, str(values), address, str(_result)))
+        # map data to modbus_tk arguments and get response length (header + data + CRC)
+        if function_code == _FC_WRITE_MULT:
+            _quantity, _output, _frame_len = 0, data, 8
+        elif function_code == _FC_READ_WRITE:
+            _quantity, _output, _frame_len = num_read, data, 5 + 2 * num_read
+        else:
+            _quantity, _output, _frame_len = data, 0, 5 + 2 * data
 
-                # Restore Modbus timeout
-                if timeout_modbus is not None:
-                    self.client.set_timeout(self._timeout_modbus)
+        # delay before retry: allow remainder of a corrupted response to drain
+        _retry_sleep = max(self._retry_sleep, self._char_time * _frame_len)
 
-                # return result
-                return {"status": _result}
+        # bind Modbus execute to local for retry loop
+        _execute = self.client.fast_execute
 
+        # Retry loop with timeout
+        while True:
+
+            try:
+                _data = _execute(slave=slave, function_code=function_code, starting_address=address,
+                                 quantity_of_x=_quantity, output_value=_output, write_starting_address_fc23=address,
+                                 returns_raw=returns_raw)
+                if returns_raw and (len(_data) != 2 * _quantity):
+                    raise ModbusInvalidResponseError("Received %dB instead of %dB" % (len(_data), 2 * _quantity))
+                return _data
 
             # check for timeout
             except ModbusInvalidResponseError as _err:
-                if time.time() - _start_time < _timeout_command:
-                    logger.warning("%s(): failed (%s), retry" % (inspect.stack()[0].function, str(_err)))
-                    time.sleep(0.05)  # Short delay before retrying
+                if time.monotonic() - _start_time < _timeout_command:
+                    logger.warning("%s(): failed (%s), retry", function, _err)
+                    time.sleep(_retry_sleep)  # Short delay before retrying
                 else:
                     _msg = "%s(): timeout after %1.1fs (%s), abort" % \
-                           (inspect.stack()[0].function, (time.time()-_start_time), str(_err))
+                           (function, (time.monotonic()-_start_time), str(_err))
                     logger.error(_msg)
-                    if timeout_modbus is not None:
-                        self.client.set_timeout(self._timeout_modbus)
                     raise ModbusControlError(_msg)
 
-            # check for other errors
-            except (modbus.ModbusError, BaseException) as _err:
-                if type(_err) is modbus.ModbusError:
-                    _err = ModbusStatus(_err.get_exception_code()).name
+            # check for Modbus exception response from client
+            except modbus.ModbusError as _err:
                 _msg = "%s(): failed with error '%s', abort" % \
-                       (inspect.stack()[0].function, str(_err))
+                       (function, _STATUS_NAMES.get(_err.get_exception_code(), "UNKNOWN"))
+                logger.error(_msg)
+                raise ModbusControlError(_msg) from _err
+
+            # check for serial port errors. Don't catch KeyboardInterrupt, SystemExit or programming errors
+            except (serial.SerialException, OSError) as _err:
+                _msg = "%s(): failed with error '%s', abort" % (function, str(_err))
                 logger.error(_msg)
-                if timeout_modbus is not None:
-                    self.client.set_timeout(self._timeout_modbus)
                 raise ModbusControlError(_msg)
 
 
+    #########
+    # Read command window starting at reg[0] (don't modify)
+    #########
+    def _read_command_window(self, slave: int = 1, num: int = 1, raw: bool = True,
+                             timeout_command: float = None) -> list:
+        """Read holding registers starting at reg[0] for command status and result.
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        num : int
+            number of registers to read
+        raw : bool
+            use single Modbus transaction via _execute_raw()
+        timeout_command : float
+           command execution timeout [s]
+
+        Returns
+        -------
+        list
+            read register values
+        """
+        if raw:
+            return self._execute_raw(slave=slave, function_code=_FC_READ_HOLD, address=0, data=num,
+                                     timeout_command=timeout_command, function="execute_command")
+        return self.read_holding_register(slave=slave, address=0, num_out=num,
+                                          timeout_command=timeout_command)["values"]
+
+
+    #########
+    # Await command triggered w/o waiting (don't modify)
+    #########
+    def _complete_pending(self, slave: int = 1):
+        """Wait until command triggered via execute_command(wait=False) is completed and check for error.
+        On error raise exception 'ModbusControlError'
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        """
+
+        # remove first, as polling below uses _execute_raw()
+        _command, _start_time, _ready_time, _timeout_command = self._pending_commands.pop(slave)
+
+        # wait until expected completion, then poll reg[0] (and error code in reg[1]) until command is completed
+        time.sleep(max(_ready_time - time.monotonic(), 0.0))
+        _iter = 0
+        while True:
+            _reg = self._execute_raw(slave=slave, function_code=_FC_READ_HOLD, address=0, data=2,
+                                     timeout_command=_timeout_command, start_time=_start_time,
+                                     function="execute_command")
+            if _reg[0] & 0x8000 == 0:
+                break
+            time.sleep(max(min(0.002 * (1 << min(_iter, 5)), 0.05), 4 * self._char_time))
+            _iter += 1
+
+        # Check for high-level error: reg[0] bit14 = 1, error code in reg[1]
+        if _reg[0] & 0x4000 != 0:
+            _err = (_reg[1] ^ 0x8000) - 0x8000  # Convert uint16_t to int16_t
+            msg = "execute_command(): command 0x%04x failed with error (%s), abort" % \
+                  (_command, ModbusControlStatus(_err))
+            logger.error(msg)
+            raise ModbusControlError(msg)
+        logger.info("slave %d: command 0x%04x completed", slave, _command)
+
+
+    #########
+    # Wait for completion of command triggered w/o waiting (don't modify)
+    #########
+    @_synchronized
+    def complete_command(self, slave: int = 1):
+        """Wait until command triggered via execute_command(wait=False) is completed. No-op if none is pending.
+        Is otherwise done implicitly by next transaction to this slave. On error raise exception 'ModbusControlError'
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+
+        Returns
+        -------
+        nothing. On error raise exception 'ModbusControlError'
+        """
+        if slave in self._pending_commands:
+            self._complete_pending(slave)
+
+
     #########
     # Trigger a command on ModbusControl client (don't modify)
     #########
+    @_synchronized
     def execute_command(self, slave: int = 1, command: int = None, param_in: list = None,
-                        num_out: int = None, timeout_modbus: float = None, timeout_command: float = None):
+                        num_out: int = None, timeout_modbus: float = None, timeout_command: float = None,
+                        exec_time_hint: float = None, persist_timeout: bool = False, wait: bool = True):
         """Trigger a command on the Modbus RTU client by writing via WRITE_MULTIPLE_HOLDING_REGISTERS
            and reading results via READ_HOLDING_REGISTERS.
 
@@ -490,64 +1247,337 @@ class BaseClient:
         command : int
             application command code
         param_in : list(int16)
-            input parameters
+            input parameters (list or tuple). None for no parameters
         num_out : int
             number of return values
         timeout_modbus : float
            Modbus RTU receive timeout [s]
         timeout_command : float
            command execution timeout [s]
+        exec_time_hint : float
+           expected command execution time on client [s]. Delays first read to avoid needless polling
+        persist_timeout : bool
+           keep timeout_modbus after call instead of restoring previous value. Change via set_modbus_timeout()
+        wait : bool
+           wait for command completion. False = return after write without return values. Completion is awaited
+           and checked by next transaction to this slave or complete_command(), e.g. for long client delays
 
         Returns
         -------
         dict
-            "values": list of returned parameters (int16)
+            "values": list of returned parameters (int16). Empty if not wait
         """
 
-        # Write command (in reg[0]) with parameters (in reg[1..N])
-        self.write_holding_register(slave=slave, address=0, values=[command] + param_in,
-                                    timeout_modbus=timeout_modbus, timeout_command=timeout_command)
+        # no input parameters
+        if param_in is None:
+            param_in = ()
 
-        # Read until command is completed (reg[0] bit15 = 0) or timeout
-        while True:
-            _reg = self.read_holding_register(slave=slave, address=0, num_out=max(1 + num_out, 2),
-                                              timeout_modbus=timeout_modbus, timeout_command=timeout_command)
-            _reg = _reg["values"]
-
-            # Check if the response length is valid
-            if len(_reg) < 1:
-                logger.error("Response length is invalid %d" % len(_reg))
-                if timeout_modbus is not None:
-                    self.client.set_timeout(self._timeout_modbus)
-                raise ModbusInvalidResponseError("Response length is invalid %d" % len(_reg))
-
-            # exit loop if command is completed (reg[0] bit15 = 0)
-            _return = _reg[0]
-            if _return & 0x8000 == 0:
-                break
+        # Prepare polling before write to keep gap between write and first read minimal.
+        # Poll delay doubles from 2ms up to 50ms (2, 4, ... 32, 50ms), with lower limit of 4 characters
+        _timeout_command = timeout_command if timeout_command is not None else self._timeout_command
+        _poll_delay = 4 * self._char_time  # lower limit for poll delay
+        _num_read = 2 if num_out < 1 else 1 + num_out
+        _first_delay = self._silent_interval if exec_time_hint is None else max(self._silent_interval, exec_time_hint)
+
+        # check register range before Modbus transaction. Use single transactions if they fit in one block
+        _values = (command, *param_in)
+        self._check_range("execute_command", 0, max(len(_values), _num_read), self.MODBUS_NUM_HOLD_REG)
+        _raw = (len(_values) <= MODBUS_BLOCKSIZE) and (_num_read <= MODBUS_BLOCKSIZE)
+        _fc23 = self.MODBUS_FC23 and _raw and (exec_time_hint is None) and wait
+
+        # Set Modbus receive timeout for complete command [s]. Is restored on exit
+        with self._scoped_timeout(timeout_modbus, persist=persist_timeout):
+
+            # Write command (in reg[0]) with parameters (in reg[1..N]) and read result in one transaction
+            _reg = None
+            if _fc23:
+                _reg = self._execute_raw(slave=slave, function_code=_FC_READ_WRITE, address=0, data=_values,
+                                         num_read=_num_read, timeout_command=timeout_command,
+                                         function="execute_command")
+
+            # Write command (in reg[0]) with parameters (in reg[1..N])
+            elif _raw:
+                self._execute_raw(slave=slave, function_code=_FC_WRITE_MULT, address=0, data=_values,
+                                  timeout_command=timeout_command, function="execute_command")
+            else:
+                self.write_holding_register(slave=slave, address=0, values=_values, timeout_command=timeout_command)
+
+            # don't wait for completion -> remember command for next transaction to this slave
+            if not wait:
+                _now = time.monotonic()
+                self._pending_commands[slave] = (command, _now, _now + _first_delay, _timeout_command)
+                logger.info("slave %d: command 0x%04x with %s triggered", slave, command, param_in)
+                return {"values": []}
+
+            # Wait for Modbus silent interval (required by RTU framing) or expected execution time before first read
+            if not _fc23:
+                time.sleep(_first_delay)
+
+            # Read until command is completed (reg[0] bit15 = 0) or timeout. First read is speculative and reads the
+            # complete window, as short commands are typically done already. While pending only poll reg[0] and read
+            # payload once after completion
+            _num_poll = _num_read
+            _iter = 0
+            _read = self._read_command_window  # bind to local for polling loop
+            while True:
+                if _reg is None:
+                    _reg = _read(slave=slave, num=_num_poll, raw=_raw, timeout_command=timeout_command)
+
+                # Check if the response length is valid
+                if len(_reg) < 1:
+                    logger.error("Response length is invalid %d", len(_reg))
+                    raise ModbusInvalidResponseError("Response length is invalid %d" % len(_reg))
+
+                # exit loop if command is completed (reg[0] bit15 = 0)
+                _return = _reg[0]
+                if _return & 0x8000 == 0:
+                    break
+
+                # command still pending -> adaptive poll delay 2ms, 4ms, ... 32ms, 50ms max
+                time.sleep(max(min(0.002 * (1 << min(_iter, 5)), 0.05), _poll_delay))
+                _iter += 1
+                _num_poll = 1
+                _reg = None
+
+            # Read payload (or only error code on error) once after completion, unless already contained in last poll
+            _num_final = 2 if _return & 0x4000 != 0 else _num_read
+            if len(_reg) < _num_final:
+                _reg = _read(slave=slave, num=_num_final, raw=_raw, timeout_command=timeout_command)
+
+            # Check for high-level error: reg[0] bit14 = 1, error code in reg[1]
+            if _return & 0x4000 != 0:
+                if len(_reg) < 2:
+                    logger.error("Expected error code in response but response length is too short, abort")
+                    raise ModbusControlError("Response too short to contain error code, abort")
+                _err = (_reg[1] ^ 0x8000) - 0x8000  # Convert uint16_t to int16_t
+                msg = "execute_command() failed with error (%s), abort" % ModbusControlStatus(_err)
+                logger.error(msg)
+                raise ModbusControlError(msg)
+
+            # No error -> return success and read parameters (starts at reg[1])
+            logger.info("slave %d: command 0x%04x with %s -> %s", slave, command, param_in, _reg)
+            return {"values": list(_reg[1:1 + num_out])}
 
-        # Check for high-level error: reg[0] bit14 = 1, error code in reg[1]
-        if _return & 0x4000 != 0:
-            if len(_reg) < 2:
-                logger.error("Expected error code in response but response length is too short, abort")
-                if timeout_modbus is not None:
-                    self.client.set_timeout(self._timeout_modbus)            
-                raise ModbusControlError("Response too short to contain error code, abort")
-            _err = _reg[1]
-            if _err > 2 ** 15:  # Convert to uint16_t to int16_t
-                _err = -(2 ** 16 - _err)
-            msg = "_execute_command() failed with error (%s), abort" % ModbusControlStatus(_err)
-            logger.error(msg)
-            if timeout_modbus is not None:
-                self.client.set_timeout(self._timeout_modbus)            
-            raise ModbusControlError(msg)
 
-        # Restore Modbus timeout
-        if timeout_modbus is not None:
-            self.client.set_timeout(self._timeout_modbus)
-        
-        # No error -> return success and read parameters (starts at reg[1])
-        return {"values": _reg[1:1 + num_out]}
+    #########
+    # Trigger several commands as pipelined batch (don't modify)
+    #########
+    @_synchronized
+    def execute_batch(self, commands: list = None, timeout_modbus: float = None, timeout_command: float = None,
+                      persist_timeout: bool = False):
+        """Trigger several commands on one or more Modbus RTU clients. All commands are written back-to-back,
+           then pending clients are polled round-robin, and results are read once per command.
+           Commands to the same slave are executed in subsequent rounds, as they share the command registers.
+           On error raise exception 'ModbusControlError'
+
+        Parameters
+        ----------
+        commands : list
+            list of tuples (slave, command, param_in, num_out), see execute_command()
+        timeout_modbus : float
+           Modbus RTU receive timeout [s]
+        timeout_command : float
+           command execution timeout [s]
+        persist_timeout : bool
+           keep timeout_modbus after call instead of restoring previous value. Change via set_modbus_timeout()
+
+        Returns
+        -------
+        dict
+            "values": list of returned parameters (int16) for each command, in order of commands
+
+        Examples
+        --------
+        >>> result = device.execute_batch(commands=[(1, 0x8001, [13, 1], 0), (2, 0x8002, [8], 2)])
+        """
+
+        # split commands into rounds with max. one command per slave
+        _rounds = []
+        for _idx, (_slave, _command, _param_in, _num_out) in enumerate(commands):
+            _values = (_command, *(_param_in if _param_in is not None else ()))
+            _num_read = 2 if _num_out < 1 else 1 + _num_out
+            self._check_range("execute_batch", 0, max(len(_values), _num_read), self.MODBUS_NUM_HOLD_REG)
+            _raw = (len(_values) <= MODBUS_BLOCKSIZE) and (_num_read <= MODBUS_BLOCKSIZE)
+            _entry = (_idx, _slave, _values, _num_out, _num_read, _raw)
+            for _round in _rounds:
+                if all(_other[1] != _slave for _other in _round):
+                    _round.append(_entry)
+                    break
+            else:
+                _rounds.append([_entry])
+
+        # Set Modbus receive timeout for complete batch [s]. Is restored on exit
+        _result = [None] * len(commands)
+        with self._scoped_timeout(timeout_modbus, persist=persist_timeout):
+            for _round in _rounds:
+
+                # write all commands without waiting for completion
+                for _idx, _slave, _values, _num_out, _num_read, _raw in _round:
+                    if _raw:
+                        self._execute_raw(slave=_slave, function_code=_FC_WRITE_MULT, address=0, data=_values,
+                                          timeout_command=timeout_command, function="execute_batch")
+                    else:
+                        self.write_holding_register(slave=_slave, address=0, values=_values,
+                                                    timeout_command=timeout_command)
+
+                # Wait for Modbus silent interval before first read
+                time.sleep(self._silent_interval)
+
+                # poll reg[0] of pending clients round-robin until all commands are completed
+                _pending = list(_round)
+                _iter = 0
+                while True:
+                    _still_pending = []
+                    for _entry in _pending:
+                        _reg = self._read_command_window(slave=_entry[1], num=1, raw=_entry[5],
+                                                         timeout_command=timeout_command)
+                        if len(_reg) < 1:
+                            logger.error("Response length is invalid %d", len(_reg))
+                            raise ModbusInvalidResponseError("Response length is invalid %d" % len(_reg))
+                        if _reg[0] & 0x8000 != 0:
+                            _still_pending.append(_entry)
+                    _pending = _still_pending
+                    if not _pending:
+                        break
+
+                    # commands still pending -> adaptive poll delay 2ms, 4ms, ... 32ms, 50ms max
+                    time.sleep(max(min(0.002 * (1 << min(_iter, 5)), 0.05), 4 * self._char_time))
+                    _iter += 1
+
+                # read results once per command and check for high-level error: reg[0] bit14 = 1
+                for _idx, _slave, _values, _num_out, _num_read, _raw in _round:
+                    _reg = self._read_command_window(slave=_slave, num=_num_read, raw=_raw,
+                                                     timeout_command=timeout_command)
+                    if _reg[0] & 0x4000 != 0:
+                        _err = (_reg[1] ^ 0x8000) - 0x8000  # Convert uint16_t to int16_t
+                        msg = "execute_batch(): slave %d command 0x%04x failed with error (%s), abort" % \
+                              (_slave, _values[0], ModbusControlStatus(_err))
+                        logger.error(msg)
+                        raise ModbusControlError(msg)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("slave %d: command 0x%04x with %s -> %s", _slave, _values[0], _values[1:], _reg)
+                    _result[_idx] = list(_reg[1:1 + _num_out])
+
+        # return results in order of commands
+        return {"values": _result}
+
+
+    #########
+    # Trigger several commands on one client in one transaction (don't modify)
+    #########
+    @_synchronized
+    def execute_pipelined(self, slave: int = 1, commands: list = None, timeout_modbus: float = None,
+                          timeout_command: float = None, persist_timeout: bool = False):
+        """Trigger several commands on one Modbus RTU client via the client multi-command MODBUS_CMD_MULTI.
+           All commands are packed into one WRITE_MULTIPLE_HOLDING_REGISTERS as blocks [command, length, param_in]
+           and results are read with one READ_HOLDING_REGISTERS. Client executes commands in order and aborts on
+           first error. If MODBUS_CMD_MULTI is not set, commands are executed one by one.
+           On error raise exception 'ModbusControlError'
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        commands : list
+            list of tuples (command, param_in, num_out), see execute_command()
+        timeout_modbus : float
+           Modbus RTU receive timeout [s]
+        timeout_command : float
+           command execution timeout [s]
+        persist_timeout : bool
+           keep timeout_modbus after call instead of restoring previous value. Change via set_modbus_timeout()
+
+        Returns
+        -------
+        dict
+            "values": list of returned parameters (int16) for each command, in order of commands
+
+        Examples
+        --------
+        >>> result = device.execute_pipelined(slave=1, commands=[(0x8001, [13, 1], 0), (0x8002, [8], 2)])
+        """
+
+        # client has no multi-command -> execute commands one by one
+        if self.MODBUS_CMD_MULTI is None:
+            with self._scoped_timeout(timeout_modbus, persist=persist_timeout):
+                return {"values": [self.execute_command(slave=slave, command=_command, param_in=_param_in,
+                                                        num_out=_num_out, timeout_command=timeout_command)["values"]
+                                   for _command, _param_in, _num_out in commands]}
+
+        # pack commands as blocks [command, length, param_in]. Block is large enough for parameters and results
+        _param = [len(commands)]
+        _offsets = []
+        for _command, _param_in, _num_out in commands:
+            _param_in = _param_in if _param_in is not None else ()
+            _len = max(len(_param_in), _num_out, 1)
+            _param += [_command, _len, *_param_in] + [0] * (_len - len(_param_in))
+            _offsets.append((len(_param) - _len, _num_out))
+
+        # execute multi-command. Returned values start at reg[1], i.e. indices are same as in _param
+        _values = self.execute_command(slave=slave, command=self.MODBUS_CMD_MULTI, param_in=_param,
+                                       num_out=len(_param), timeout_modbus=timeout_modbus,
+                                       timeout_command=timeout_command, persist_timeout=persist_timeout)["values"]
+
+        # return results in order of commands
+        return {"values": [_values[_start:_start + _num_out] for _start, _num_out in _offsets]}
+
+
+    #########
+    # clear cache of static input registers (don't modify)
+    #########
+    def clear_cache(self, slave: int = None):
+        """Clear cached static input registers, see read_input_register(cacheable=True). Required e.g. after
+        client reset or firmware update
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier. None = all slaves
+
+        Returns
+        -------
+        nothing
+        """
+        with self._lock:
+            if slave is None:
+                self._static_cache.clear()
+            else:
+                for _key in [_key for _key in self._static_cache if _key[0] == slave]:
+                    del self._static_cache[_key]
+
+
+    #########
+    # wait until client is ready
+    #########
+    def wait_for_client(self, slave: int = 1, timeout: float = 1.5):
+        """Wait until client responds to ModbusControl protocol version check, e.g. after Arduino bootloader.
+        Probes via check_protocol_version() until success or timeout. Returns immediately for running clients.
+        On error raise exception 'ModbusControlError'
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        timeout : float
+            max. time to wait for client [s]
+
+        Returns
+        -------
+        nothing. On error raise exception 'ModbusControlError'
+        """
+
+        # client may have been reset -> drop cached static registers, then probe until it responds or timeout
+        self.clear_cache(slave=slave)
+        _deadline = time.monotonic() + timeout
+        while time.monotonic() < _deadline:
+            try:
+                self.check_protocol_version(slave=slave)
+                return
+            except ModbusControlError:
+                time.sleep(0.05)
+
+        # final attempt. Raises exception on failure
+        self.check_protocol_version(slave=slave)
 
 
     #########
@@ -567,14 +1597,110 @@ class BaseClient:
          -------
          nothing. On error raise exception 'ModbusControlError'
         """
-        _return = self.read_input_register(slave=slave, address=MODBUSCONTROL_ADDR_PROTOCOL, num_out=1)
-        _version = str(round(float(_return["values"][0]*0.1), 1))
-        if _version != MODBUSCONTROL_PROTOCOL:
-            _msg = "ModbusControl protocol version mismatch %s vs. %s" % (MODBUSCONTROL_PROTOCOL, _version)
-            logger.error("%s() failed with error: %s" % (inspect.stack()[0].function, _msg))
+        _return = self.read_input_register(slave=slave, address=MODBUSCONTROL_ADDR_PROTOCOL, num_out=1,
+                                           cacheable=True)
+        _version = _return["values"][0]
+        if _version != MODBUSCONTROL_PROTOCOL_INT:
+            _msg = "ModbusControl protocol version mismatch %s vs. %d.%d" % \
+                   (MODBUSCONTROL_PROTOCOL, _version // 10, _version % 10)
+            logger.error("check_protocol_version() failed with error: %s", _msg)
             raise ModbusControlError(_msg)
 
 
+    #########
+    # bind client methods to a slave (don't modify)
+    #########
+    def bind(self, slave: int = 1):
+        """Return a proxy whose methods are bound to one slave, e.g. for devices with fixed slave identifier.
+        Calls are forwarded to this client with argument slave preset, see _SlaveView.
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+
+        Returns
+        -------
+            proxy object with the methods of this client
+
+        Examples
+        --------
+        >>> device = client.bind(slave=2)
+        >>> device.set_pin(13, 1)
+        """
+        return _SlaveView(self, slave)
+
+
+    #########
+    # run blocking method asynchronously (don't modify)
+    #########
+    async def _arun(self, function, **kwargs):
+        """Run a blocking method in the dedicated I/O thread (async_io=True) or the default executor.
+        Base for asynchronous variants of client methods, e.g. in derived classes
+
+        Parameters
+        ----------
+        function : callable
+            blocking (bound) method to run
+        kwargs :
+            keyword arguments passed to function
+
+        Returns
+        -------
+            return value of function
+        """
+        _loop = asyncio.get_running_loop()
+        return await _loop.run_in_executor(self._io_executor, functools.partial(function, **kwargs))
+
+
+    #########
+    # asynchronous read of input registers (don't modify)
+    #########
+    async def aread_input_register(self, **kwargs) -> dict:
+        """Asynchronous variant of read_input_register(). Runs the transaction in the dedicated I/O thread
+        (async_io=True) or the default executor, so transactions on different ports can overlap,
+        e.g. via asyncio.gather().
+
+        Parameters
+        ----------
+        see read_input_register()
+
+        Returns
+        -------
+        dict
+            "values": list of returned values (int16)
+
+        Examples
+        --------
+        >>> result = await device.aread_input_register(address=1, num_out=2)
+        """
+        return await self._arun(self.read_input_register, **kwargs)
+
+
+    #########
+    # asynchronous command execution (don't modify)
+    #########
+    async def aexecute_command(self, **kwargs) -> dict:
+        """Asynchronous variant of execute_command(). Runs the command in the dedicated I/O thread
+        (async_io=True) or the default executor, so commands on different ports can overlap,
+        e.g. via asyncio.gather().
+
+        Parameters
+        ----------
+        see execute_command()
+
+        Returns
+        -------
+        dict
+            "values": list of returned parameters (int16)
+
+        Examples
+        --------
+        >>> result = await device.aexecute_command(command=0x8001, param_in=[13, 1], num_out=0)
+        """
+        return await self._arun(self.execute_command, **kwargs)
+
+
 ####################################################################
 # MODULE TEST
 ####################################################################
@@ -602,12 +1728,9 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.WARNING)
     logger = logging.getLogger(__name__)
 
-    # connect to the Modbus client
-    client = BaseClient(port=args.port, baud=args.baud)
-
-    # avoid USB communication while Arduino is still in bootloader
+    # connect to the Modbus client and wait until Arduino has left bootloader
     print("wait for Arduino bootloader ... ", end="", flush=True)
-    time.sleep(2.5)
+    client = BaseClient(port=args.port, baud=args.baud, boot_delay=2.5)
     print("done")
 
     # print delimiter
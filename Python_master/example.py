@@ -23,7 +23,6 @@ Class
 # IMPORT REQUIRED MODULES
 ###########
 import ModbusControl
-import inspect
 import logging
 logger = logging.getLogger(__name__)
 
@@ -40,9 +39,19 @@ class Client(ModbusControl.BaseClient):
     baud : int
         Communication speed [Baud]. Must be supported by driver
     timeout_modbus : float
-        Default Modbus RTU receive timeout [s]
+        Default Modbus RTU receive timeout [s]. None = 20ms if USB latency timer was reduced, else 100ms
     timeout_command : float
         Default command execution timeout [s]
+    boot_delay : float
+        Max. time to wait for client to become ready, e.g. Arduino bootloader [s]. None = don't wait
+    async_io : bool
+        Run all Modbus transactions in a dedicated thread owning the port, e.g. for GUI or asyncio applications
+    verbose : bool
+        Log Modbus RTU frames via modbus_tk and applied realtime settings. None = only if debug output is enabled
+    realtime : bool
+        Pin I/O thread to last allowed CPU and raise its priority (POSIX: SCHED_FIFO, requires CAP_SYS_NICE or root.
+        Windows: HIGH_PRIORITY_CLASS, may require admin). Applies to I/O thread if async_io, else calling thread.
+        Linux: also sets USB-serial latency_timer to 1ms via sysfs (system-wide until re-plug)
 
     Returns
     -------
@@ -54,6 +63,10 @@ class Client(ModbusControl.BaseClient):
     >>> device = example.Client(port="COM6", baud=115200)
     """
 
+    # number of ModbusControl client input and holding registers (must match client)
+    MODBUS_NUM_INPUT_REG = 3            # number of Modbus input registers
+    MODBUS_NUM_HOLD_REG = 100           # number of Modbus holding registers
+
     # ModbusControl client input register addresses (only read, no command trigger)
     # Note: address 0 is reserved for ModbusControl protocol version
     MODBUS_ADDR_VERSION = 1             # Modbus input register address: client firmware version
@@ -65,14 +78,20 @@ class Client(ModbusControl.BaseClient):
     MODBUS_CMD_GET_PIN          = 0x8002        # Remote command: corresponds to digitalRead(pin)
     MODBUS_CMD_DELAY            = 0x8003        # Remote command: corresponds to delay(ms)
     MODBUS_CMD_DELAY_NOSERIAL   = 0x8004        # Remote command: corresponds to delay() w/o UART buffering
+    MODBUS_CMD_MULTI            = 0x8005        # Remote command: execute list of commands in one transaction
     MODBUS_CMD_TEST             = 0xBFFF        # Remote command: dummy test command
 
+    # timeout margins on top of client delay time for delay commands [s]. Only affect error detection, not latency
+    DELAY_MARGIN_MODBUS = 0.01          # Modbus receive timeout margin
+    DELAY_MARGIN_COMMAND = 0.2          # command execution timeout margin
+
 
     #########
     # constructor
     #########
-    def __init__(self, port: str = "/dev/ttyUSB0", baud: int = 115200, timeout_modbus: float = 0.1,
-                 timeout_command: float = 0.2):
+    def __init__(self, port: str = "/dev/ttyUSB0", baud: int = 115200, timeout_modbus: float = None,
+                 timeout_command: float = 0.2, boot_delay: float = None, async_io: bool = False,
+                 verbose: bool = None, realtime: bool = False):
         """
         Create an object to control an Arduino via ModbusControl protocol.
 
@@ -83,9 +102,19 @@ class Client(ModbusControl.BaseClient):
         baud : int
             Communication speed [Baud]. Must be supported by driver
         timeout_modbus : float
-            Default Modbus RTU receive timeout [s]
+            Default Modbus RTU receive timeout [s]. None = 20ms if USB latency timer was reduced, else 100ms
         timeout_command : float
             Default command execution timeout [s]
+        boot_delay : float
+            Max. time to wait for client to become ready, e.g. Arduino bootloader [s]. None = don't wait
+        async_io : bool
+            Run all Modbus transactions in a dedicated thread owning the port, e.g. for GUI or asyncio applications
+        verbose : bool
+            Log Modbus RTU frames via modbus_tk and applied realtime settings. None = only if debug output is enabled
+        realtime : bool
+            Pin I/O thread to last allowed CPU and raise its priority (POSIX: SCHED_FIFO, requires CAP_SYS_NICE or root.
+            Windows: HIGH_PRIORITY_CLASS, may require admin). Applies to I/O thread if async_io, else calling thread.
+            Linux: also sets USB-serial latency_timer to 1ms via sysfs (system-wide until re-plug)
 
         Returns
         -------
@@ -99,7 +128,11 @@ class Client(ModbusControl.BaseClient):
 
         # just call base class constructor here
         ModbusControl.BaseClient.__init__(self, port=port, baud=baud, timeout_modbus=timeout_modbus,
-                                          timeout_command=timeout_command)
+                                          timeout_command=timeout_command, boot_delay=boot_delay,
+                                          async_io=async_io, verbose=verbose, realtime=realtime)
+
+        # last output states set by this client, key is (slave, pin). See read_output_state()
+        self._pin_shadow = {}
 
 
     #########
@@ -107,7 +140,7 @@ class Client(ModbusControl.BaseClient):
     #########
     def read_version(self, slave: int = 1) -> dict:
         """Read client software version.
-        Is performed as read w/o parameters via READ_INPUT_REGISTERS.
+        Is performed as read w/o parameters via READ_INPUT_REGISTERS. Is cached after first read, see clear_cache().
 
         Parameters
         ----------
@@ -127,11 +160,10 @@ class Client(ModbusControl.BaseClient):
         """
         _address = Client.MODBUS_ADDR_VERSION
         _num_out = 1
-        _status = self.read_input_register(slave=slave, address=_address, num_out=_num_out)
-        logger.info("%s(): slave %d: read %dB from inputReg address %d -> %s" %
-                    (inspect.stack()[0].function, slave, _num_out, _address, str(_status)))
-        _major = int(_status["values"][0]/10)
-        _minor = _status["values"][0] - 10 * _major
+        _status = self.read_input_register(slave=slave, address=_address, num_out=_num_out, cacheable=True)
+        logger.info("read_version(): slave %d: read %dB from inputReg address %d -> %s",
+                    slave, _num_out, _address, _status)
+        _major, _minor = divmod(_status["values"][0], 10)
         return {"version": {"major": _major, "minor": _minor}}
 
 
@@ -161,11 +193,45 @@ class Client(ModbusControl.BaseClient):
         _address = Client.MODBUS_ADDR_UPTIME
         _num_out = 1
         _status = self.read_input_register(slave=slave, address=_address, num_out=_num_out)
-        logger.info("%s(): slave %d: read %dB from inputReg address %d -> %s" %
-                    (inspect.stack()[0].function, slave, _num_out, _address, str(_status)))
+        logger.info("read_uptime(): slave %d: read %dB from inputReg address %d -> %s",
+                    slave, _num_out, _address, _status)
         return {"millis": _status["values"][0]}
 
 
+    #########
+    # read client firmware version and uptime
+    #########
+    def read_status(self, slave: int = 1) -> dict:
+        """Read client software version and uptime [ms] in one transaction.
+        Is performed as read w/o parameters via READ_INPUT_REGISTERS of consecutive addresses.
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+
+        Returns
+        -------
+        dict
+            version: {"major": major, "minor": minor}
+            millis: uptime [ms]
+
+        Examples
+        --------
+        >>> import example
+        >>> device = example.Client(port="COM6", baud=115200)
+        >>> print(device.read_status())
+        """
+        _address = Client.MODBUS_ADDR_VERSION
+        _num_out = Client.MODBUS_ADDR_UPTIME - Client.MODBUS_ADDR_VERSION + 1
+        _status = self.read_input_register(slave=slave, address=_address, num_out=_num_out)
+        logger.info("read_status(): slave %d: read %dB from inputReg address %d -> %s",
+                    slave, _num_out, _address, _status)
+        _major, _minor = divmod(_status["values"][0], 10)
+        return {"version": {"major": _major, "minor": _minor},
+                "millis": _status["values"][Client.MODBUS_ADDR_UPTIME - _address]}
+
+
     #########
     # set client pin state
     #########
@@ -192,9 +258,10 @@ class Client(ModbusControl.BaseClient):
         >>> device = example.Client(port="COM6", baud=115200)
         >>> device.set_pin(pin=13, state=True)
         """
-        _status = self.execute_command(slave=slave, command=Client.MODBUS_CMD_SET_PIN, param_in=[pin, state], num_out=0)
-        logger.info("%s(): slave %d set pin %d = %d -> %s" %
-                    (inspect.stack()[0].function, slave, pin, state, str(_status)))
+        _status = self.execute_command(slave=slave, command=Client.MODBUS_CMD_SET_PIN, param_in=(pin, state), num_out=0)
+        self._pin_shadow[(slave, pin)] = int(state)
+        logger.info("set_pin(): slave %d set pin %d = %d -> %s",
+                    slave, pin, state, _status)
         return
 
 
@@ -223,15 +290,118 @@ class Client(ModbusControl.BaseClient):
         >>> device = example.Client(port="COM6", baud=115200)
         >>> print(device.read_pin(pin=8)["state"])
         """
-        _status = self.execute_command(slave=slave, command=Client.MODBUS_CMD_GET_PIN, param_in=[pin], num_out=2)
-        logger.info("%s(): slave %d: read pin %d -> %s" % (inspect.stack()[0].function, slave, pin, str(_status)))
+        _status = self.execute_command(slave=slave, command=Client.MODBUS_CMD_GET_PIN, param_in=(pin,), num_out=2)
+        self._pin_shadow.pop((slave, pin), None)  # pin is now input
+        logger.info("read_pin(): slave %d: read pin %d -> %s", slave, pin, _status)
         return {"state": _status["values"][1]}
 
 
+    #########
+    # set several client pin states in one transaction (application specific)
+    #########
+    def set_pins(self, slave: int = 1, pins: list = None):
+        """Set several pin states. Corresponds to Arduino digitalWrite() for each pin.
+        Is performed via one multi-command, i.e. WRITE_MULTIPLE_HOLDING_REGISTERS and READ_HOLDING_REGISTERS.
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        pins : list
+            list of tuples (pin, state) with pin number and pin state (1=high, 0=low)
+
+        Returns
+        -------
+        nothing
+
+        Examples
+        --------
+        >>> import example
+        >>> device = example.Client(port="COM6", baud=115200)
+        >>> device.set_pins(pins=[(13, 1), (12, 0)])
+        """
+        try:
+            _status = self.execute_pipelined(slave=slave, commands=[(Client.MODBUS_CMD_SET_PIN, (_pin, _state), 0)
+                                                                    for _pin, _state in pins])
+
+        # client has applied commands before failed one -> states of these pins are unknown
+        except ModbusControl.ModbusControlError:
+            for _pin, _state in pins:
+                self._pin_shadow.pop((slave, _pin), None)
+            raise
+        for _pin, _state in pins:
+            self._pin_shadow[(slave, _pin)] = int(_state)
+        logger.info("set_pins(): slave %d set pins %s -> %s", slave, pins, _status)
+        return
+
+
+    #########
+    # read several client pin states in one transaction (application specific)
+    #########
+    def read_pins(self, slave: int = 1, pins: list = None) -> dict:
+        """Read several pin states. Corresponds to Arduino digitalRead() for each pin.
+        Is performed via one multi-command, i.e. WRITE_MULTIPLE_HOLDING_REGISTERS and READ_HOLDING_REGISTERS.
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        pins : list
+            list of pin numbers
+
+        Returns
+        -------
+        dict
+            "states": list of pin states, in order of pins
+
+        Examples
+        --------
+        >>> import example
+        >>> device = example.Client(port="COM6", baud=115200)
+        >>> print(device.read_pins(pins=[7, 8])["states"])
+        """
+        _status = self.execute_pipelined(slave=slave, commands=[(Client.MODBUS_CMD_GET_PIN, (_pin,), 2)
+                                                                for _pin in pins])
+        for _pin in pins:
+            self._pin_shadow.pop((slave, _pin), None)  # pin is now input
+        logger.info("read_pins(): slave %d: read pins %s -> %s", slave, pins, _status)
+        return {"states": [_values[1] for _values in _status["values"]]}
+
+
+    #########
+    # last output state set by this client (application specific)
+    #########
+    def read_output_state(self, slave: int = 1, pin: int = None) -> dict:
+        """Return pin state last set via set_pin() or set_pins() without Modbus transaction.
+        Only valid if the pin is changed exclusively by this client, not by client firmware or external circuitry.
+        Note: read_pin() configures the pin as input on client, which drops the stored state.
+
+        Parameters
+        ----------
+        slave : int
+            Modbus slave identifier
+        pin : int
+            pin number
+
+        Returns
+        -------
+        dict
+            "state": pin state (1=high, 0=low), None if not set by this client
+
+        Examples
+        --------
+        >>> import example
+        >>> device = example.Client(port="COM6", baud=115200)
+        >>> device.set_pin(pin=13, state=1)
+        >>> print(device.read_output_state(pin=13)["state"])
+        """
+        return {"state": self._pin_shadow.get((slave, pin))}
+
+
     #########
     # wait time [ms] (application specific)
     #########
-    def delay(self, slave: int = 1, millis: int = None):
+    def delay(self, slave: int = 1, millis: int = None, wait: bool = True):
         """Wait some time [ms]. Corresponds to Arduino delay().
         Is performed via WRITE_MULTIPLE_HOLDING_REGISTERS and READ_HOLDING_REGISTERS.
 
@@ -241,6 +411,9 @@ class Client(ModbusControl.BaseClient):
             Modbus slave identifier
         millis : int
             time to wait [ms]
+        wait : bool
+            wait until client delay is finished. False = return immediately. Next call to this client waits
+            for completion, see execute_command()
 
         Returns
         -------
@@ -253,20 +426,21 @@ class Client(ModbusControl.BaseClient):
         >>> device.delay(millis=100)
         """
         # set appropriate modbus and command timeout [s]
-        _timeout_modbus = millis / 1000 + 0.01
-        _timeout_command = millis / 1000 + 0.2
+        _timeout_modbus = millis / 1000 + Client.DELAY_MARGIN_MODBUS
+        _timeout_command = millis / 1000 + Client.DELAY_MARGIN_COMMAND
 
         # execute command
         _status = self.execute_command(slave=slave, command=Client.MODBUS_CMD_DELAY, timeout_modbus=_timeout_modbus,
-                                       timeout_command=_timeout_command, param_in=[millis], num_out=0)
-        logger.info("%s(): slave %d: delay %d ms -> %s" % (inspect.stack()[0].function, slave, millis, str(_status)))
+                                       timeout_command=_timeout_command, exec_time_hint=millis / 1000,
+                                       param_in=(millis,), num_out=0, wait=wait)
+        logger.info("delay(): slave %d: delay %d ms -> %s", slave, millis, _status)
         return
 
 
     #########
     # wait time [ms] without Modbus handling (application specific)
     #########
-    def delay_no_serial(self, slave: int = 1, millis: int = None):
+    def delay_no_serial(self, slave: int = 1, millis: int = None, wait: bool = True):
         """Wait some time [ms] without Modbus handling. Corresponds to Arduino delay(),
         but Modbus is not handled.
         Is performed via WRITE_MULTIPLE_HOLDING_REGISTERS and READ_HOLDING_REGISTERS.
@@ -277,6 +451,9 @@ class Client(ModbusControl.BaseClient):
             Modbus slave identifier
         millis : int
             time to wait [ms]
+        wait : bool
+            wait until client delay is finished. False = return immediately. Next call to this client waits
+            for completion, see execute_command()
 
         Returns
         -------
@@ -289,19 +466,88 @@ class Client(ModbusControl.BaseClient):
         >>> device.delay_no_serial(millis=100)
         """
 
-        # set appropriate command timeout [s]
-        _timeout_modbus = millis / 1000 + 0.01
-        _timeout_command = millis / 1000 + 0.1
+        # set appropriate modbus and command timeout [s]
+        _timeout_modbus = millis / 1000 + Client.DELAY_MARGIN_MODBUS
+        _timeout_command = millis / 1000 + Client.DELAY_MARGIN_COMMAND
 
         # execute command
         _status = self.execute_command(slave=slave, command=Client.MODBUS_CMD_DELAY_NOSERIAL,
                                        timeout_modbus=_timeout_modbus, timeout_command=_timeout_command,
-                                       param_in=[millis], num_out=0)
-        logger.info("%s(): slave %d: delay %d ms w/o UART handling -> %s" %
-                    (inspect.stack()[0].function, slave, millis, str(_status)))
+                                       exec_time_hint=millis / 1000, param_in=(millis,), num_out=0, wait=wait)
+        logger.info("delay_no_serial(): slave %d: delay %d ms w/o UART handling -> %s",
+                    slave, millis, _status)
         return
 
 
+    #########
+    # asynchronous read of client firmware version and uptime (application specific)
+    #########
+    async def aread_status(self, slave: int = 1) -> dict:
+        """Asynchronous variant of read_status(). Reads of several clients on different ports overlap,
+        e.g. via asyncio.gather().
+
+        Parameters
+        ----------
+        see read_status()
+
+        Returns
+        -------
+        dict
+            version: {"major": major, "minor": minor}
+            millis: uptime [ms]
+
+        Examples
+        --------
+        >>> results = await asyncio.gather(*[device.aread_status() for device in devices])
+        """
+        return await self._arun(self.read_status, slave=slave)
+
+
+    #########
+    # asynchronous set client pin state (application specific)
+    #########
+    async def aset_pin(self, slave: int = 1, pin: int = None, state: int = None):
+        """Asynchronous variant of set_pin(). Commands to clients on different ports overlap,
+        e.g. via asyncio.gather().
+
+        Parameters
+        ----------
+        see set_pin()
+
+        Returns
+        -------
+        nothing
+
+        Examples
+        --------
+        >>> await asyncio.gather(*[device.aset_pin(pin=13, state=1) for device in devices])
+        """
+        return await self._arun(self.set_pin, slave=slave, pin=pin, state=state)
+
+
+    #########
+    # asynchronous read client pin state (application specific)
+    #########
+    async def aread_pin(self, slave: int = 1, pin: int = None) -> dict:
+        """Asynchronous variant of read_pin(). Commands to clients on different ports overlap,
+        e.g. via asyncio.gather().
+
+        Parameters
+        ----------
+        see read_pin()
+
+        Returns
+        -------
+        dict
+            "state": pin state
+
+        Examples
+        --------
+        >>> results = await asyncio.gather(*[device.aread_pin(pin=8) for device in devices])
+        """
+        return await self._arun(self.read_pin, slave=slave, pin=pin)
+
+
 ####################################################################
 # MODULE TEST
 ####################################################################
@@ -325,65 +571,78 @@ if __name__ == "__main__":
         parser.add_argument('-p', '--port', type=str, help='port name', required=False, default='/dev/ttyUSB0')
         # parser.add_argument('-p', '--port', type=str, help='port name', required=False, default='/dev/ttyACM0')
     parser.add_argument('-b', '--baud', type=int, help='baud', required=False, default=115200)
-    parser.add_argument('-i', '--id', type=int, help='slave ID', required=False, default=1)
+    parser.add_argument('-i', '--id', type=int, nargs='+', help='slave ID(s) on bus', required=False, default=[1])
     args = parser.parse_args()
 
     # set logging level
     logging.basicConfig(level=logging.ERROR)
     logger = logging.getLogger(__name__)
 
-    # connect to the Modbus client
-    client = Client(port=args.port, baud=args.baud, timeout_modbus=0.1)
+    # connect to the Modbus client(s) and bind methods to slave IDs
+    client = Client(port=args.port, baud=args.baud)
+    devices = [(slave, client.bind(slave=slave)) for slave in args.id]
 
-    # avoid USB communication while Arduino is still in bootloader
+    # wait until Arduino has left bootloader (reset by opening port) and assert ModbusControl protocol version.
+    # Returns as soon as client responds. Exit on failure
     print("wait for Arduino bootloader ... ", end="", flush=True)
-    time.sleep(2.5)
+    for slave, device in devices:
+        device.wait_for_client(timeout=2.5)
     print("done")
 
-    # assert ModbusControl protocol version. Exit on failure
-    client.check_protocol_version(slave=args.id)
-
     # read client firmware version
-    version = client.read_version(slave=args.id)["version"]
-    print("client ID=%d SW version v%d.%d\n" % (args.id, version["major"], version["minor"]))
+    for slave, device in devices:
+        version = device.read_status()["version"]
+        print("client ID=%d SW version v%d.%d" % (slave, version["major"], version["minor"]))
+    print()
 
 
     ########
-    # main loop
+    # main loop. Client delays are triggered w/o waiting, so delays on several slaves overlap
     ########
     output_state = True
-    time_start = time.time()    # [s]
+    period = 2.5                     # loop period [s]. Must exceed client delays below plus Modbus I/O
+    time_start = time.monotonic()    # [s]
+    next_tick = time_start
     while True:
 
-        # print PC runtime [s]
-        time_curr = time.time()
-        print("runtime %1.1f s" % (time_curr - time_start))
+        # collect status lines and output once per loop
+        lines = []
 
-        # get client uptime (impacted if ISR disabled) [ms]
-        millis = client.read_uptime(slave=args.id)["millis"]
-        print("slave uptime %1.1f s" % (millis * 0.001))
+        # print PC runtime [s]
+        time_curr = time.monotonic()
+        lines.append("runtime %1.1f s" % (time_curr - time_start))
 
-        # toggle LED pin (=13)
+        # toggle LED pin (=13) and read state of pin 8 on all slaves
         output_pin = 13
-        client.set_pin(slave=args.id, pin=output_pin, state=int(output_state))
-        print("set pin %d : %d" % (output_pin, output_state))
-        output_state = not output_state
-
-        # read state of pin 8
         input_pin = 8
-        input_state = client.read_pin(slave=args.id, pin=input_pin)["state"]
-        print("read pin %d : %d" % (input_pin, input_state))
+        for slave, device in devices:
 
-        # wait some time (with serial interrupts)
+            # get client uptime (impacted if ISR disabled) [ms]
+            millis = device.read_status()["millis"]
+            lines.append("slave %d: uptime %1.1f s" % (slave, millis * 0.001))
+
+            # set and read pins in one transaction
+            result = device.execute_pipelined(commands=[(Client.MODBUS_CMD_SET_PIN, [output_pin, int(output_state)], 0),
+                                                        (Client.MODBUS_CMD_GET_PIN, [input_pin], 2)])["values"]
+            lines.append("slave %d: set pin %d : %d" % (slave, output_pin, output_state))
+            lines.append("slave %d: read pin %d : %d" % (slave, input_pin, result[1][1]))
+        output_state = not output_state
+
+        # wait some time (with serial interrupts). Don't block PC, next command to slave waits for completion
         pause = 1000  # ms
-        print("delay %1.1fs with serial interrupts" % (pause / 1000.0))
-        client.delay(slave=args.id, millis=pause)
+        lines.append("delay %1.1fs with serial interrupts" % (pause / 1000.0))
+        for slave, device in devices:
+            device.delay(millis=pause, wait=False)
 
-        # wait some time (without serial interrupts)
+        # wait some time (without serial interrupts). Don't block PC, next command to slave waits for completion
         pause = 1000  # ms
-        print("delay %1.1fs without serial interrupts" % (pause / 1000.0))
-        client.delay_no_serial(slave=args.id, millis=pause)
+        lines.append("delay %1.1fs without serial interrupts" % (pause / 1000.0))
+        for slave, device in devices:
+            device.delay_no_serial(millis=pause, wait=False)
+
+        # output status with a single write, empty line indicates new loop. Console output is line buffered
+        sys.stdout.write("\n".join(lines) + "\n\n")
 
-        # indicate new loop
-        sys.stdout.write("\n")
-        sys.stdout.flush()
+        # wait for next loop start on fixed schedule. Avoids accumulating Modbus I/O time as drift
+        next_tick += period
+        time.sleep(max(0.0, next_tick - time.monotonic()))